@@ -44,15 +44,19 @@ def test_formatting():
             "singaporean",
         ]
 
-        # Test the formatting logic
-        result = "Accent probabilities:\n\n"
-        for i, lbl in enumerate(mock_labels):
-            probability = mock_probs[0, i].item() * 100
-            result += f"{str(lbl):<20}: {probability:>6.2f}%\n"
+        # Test the formatting logic (single host copy, vectorized argmax)
+        percentages = mock_probs[0].detach().cpu().numpy() * 100.0
+        result = (
+            "Accent probabilities:\n\n"
+            + "\n".join(
+                f"{str(lbl):<20}: {value:>6.2f}%"
+                for lbl, value in zip(mock_labels, percentages)
+            )
+            + "\n"
+        )
 
         # Find the most probable accent
-        best_index = torch.argmax(mock_probs, dim=1).item()
-        best_label = mock_labels[best_index]
+        best_label = mock_labels[int(percentages.argmax())]
 
         print("Formatted result:")
         print(result)
@@ -1,28 +1,203 @@
 """Accent classification using SpeechBrain models."""
 
+import functools
+import io
+import json
 import logging
 import os
+import re
+import tempfile
 import warnings
-from typing import Optional, Tuple
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Tuple, Union
 
-try:
+from .audio_processor import AudioProcessor
+from .config import get_config
+from .exceptions import (
+    AccentClassifierError,
+    AudioProcessingError,
+    ClassificationError,
+    DependencyError,
+)
+
+if TYPE_CHECKING:
+    import onnxruntime
     import torch
     import torch.nn.functional as F
+    import torchaudio
     from speechbrain.inference import EncoderClassifier
+else:
+    # Heavyweight backend modules, imported lazily by _import_backend():
+    # importing torch alone costs around a second, which would otherwise
+    # be paid by every GUI start and test collection touching this module
+    torch = None
+    F = None
+    torchaudio = None
+    EncoderClassifier = None
+    onnxruntime = None
 
-    DEPENDENCIES_AVAILABLE = True
-except ImportError as e:
-    DEPENDENCIES_AVAILABLE = False
-    MISSING_DEPENDENCY_ERROR = str(e)
+DEPENDENCIES_AVAILABLE: Optional[bool] = None
+ONNXRUNTIME_AVAILABLE = False
+MISSING_DEPENDENCY_ERROR: Optional[str] = None
+
+
+def _import_backend() -> bool:
+    """Import torch, torchaudio and speechbrain on first use.
+
+    Returns:
+        bool: True if the backend dependencies are available.
+    """
+    global torch, F, torchaudio, EncoderClassifier, onnxruntime
+    global DEPENDENCIES_AVAILABLE, ONNXRUNTIME_AVAILABLE, MISSING_DEPENDENCY_ERROR
+
+    if DEPENDENCIES_AVAILABLE is None:
+        try:
+            import torch as _torch
+            import torch.nn.functional as _F
+            import torchaudio as _torchaudio
+            from speechbrain.inference import EncoderClassifier as _EncoderClassifier
+        except ImportError as e:
+            DEPENDENCIES_AVAILABLE = False
+            MISSING_DEPENDENCY_ERROR = str(e)
+        else:
+            torch, F, torchaudio = _torch, _F, _torchaudio
+            EncoderClassifier = _EncoderClassifier
+            DEPENDENCIES_AVAILABLE = True
+
+            try:
+                import onnxruntime as _onnxruntime
+            except ImportError:
+                ONNXRUNTIME_AVAILABLE = False
+            else:
+                onnxruntime = _onnxruntime
+                ONNXRUNTIME_AVAILABLE = True
+
+    return DEPENDENCIES_AVAILABLE
 
-from .config import get_config
-from .exceptions import ClassificationError, DependencyError
 
 logger = logging.getLogger(__name__)
 
 # Suppress warnings
 warnings.filterwarnings("ignore", category=FutureWarning)
 
+# Matches the 11-character video ID in the common YouTube URL forms
+_VIDEO_ID_PATTERN = re.compile(r"(?:v=|youtu\.be/|/embed/|/shorts/)([A-Za-z0-9_-]{11})")
+
+# Default directory for cached classification results
+_DEFAULT_CACHE_DIR = Path.home() / ".accent_classifier" / "cache"
+
+
+def _extract_video_id(youtube_url: str) -> Optional[str]:
+    """Extract the canonical video ID from a YouTube URL.
+
+    Args:
+        youtube_url: The YouTube video URL.
+
+    Returns:
+        str: The 11-character video ID, or None if it cannot be found.
+    """
+    match = _VIDEO_ID_PATTERN.search(youtube_url)
+    return match.group(1) if match else None
+
+
+@functools.lru_cache(maxsize=1)
+def _get_vad() -> Tuple[Any, Any]:
+    """Load and cache the Silero VAD model and its timestamp helper.
+
+    Returns:
+        tuple: (vad_model, get_speech_timestamps).
+    """
+    vad_model, utils = torch.hub.load(
+        "snakers4/silero-vad", "silero_vad", trust_repo=True
+    )
+    get_speech_timestamps = utils[0]
+    return vad_model, get_speech_timestamps
+
+
+@functools.lru_cache(maxsize=4)
+def _get_model(
+    model_path: str, cache_dir: Optional[str]
+) -> Tuple["EncoderClassifier", "torch.nn.Module"]:
+    """Load and cache a SpeechBrain model for the given path.
+
+    Loading model weights takes several seconds, so the loaded model is
+    cached process-wide and shared by every AccentClassifier constructed
+    with the same model path.
+
+    Args:
+        model_path: Model source passed to EncoderClassifier.from_hparams.
+        cache_dir: Optional torch cache directory.
+
+    Returns:
+        tuple: (optimized model, embedding module as loaded). The second
+        element is captured before _optimize_model so that ONNX export
+        never sees modules an optimization has replaced with forms
+        torch.onnx.export cannot serialize (e.g. quantized layers).
+    """
+    # Set cache directory if specified
+    if cache_dir:
+        os.environ["TORCH_HOME"] = cache_dir
+
+    # Pin the model to one device up front so SpeechBrain never shuffles
+    # tensors between devices per call
+    device = "cuda" if torch.cuda.is_available() else "cpu"
+    run_opts = {"device": device}
+
+    # Per-model savedir: a shared directory would let one model's
+    # download marker shadow another model's weights
+    model_slug = re.sub(r"[^A-Za-z0-9._-]", "_", model_path)
+    savedir = (
+        Path(cache_dir or Path.home() / ".accent_classifier")
+        / f"speechbrain_{model_slug}"
+    )
+    marker = savedir / ".downloaded"
+
+    if marker.exists():
+        # Fully local load: skips the HuggingFace update checks
+        # (HEAD requests + JSON parsing) on every startup
+        model = EncoderClassifier.from_hparams(
+            source=str(savedir), savedir=str(savedir), run_opts=run_opts
+        )
+    else:
+        model = EncoderClassifier.from_hparams(
+            source=model_path, savedir=str(savedir), run_opts=run_opts
+        )
+        try:
+            marker.touch()
+        except OSError:
+            pass  # Next start just re-checks the hub
+
+    embedding_model = model.mods.embedding_model
+    return _optimize_model(model), embedding_model
+
+
+def _optimize_model(model: "EncoderClassifier") -> "EncoderClassifier":
+    """Apply device-appropriate reduced-precision optimizations.
+
+    On CUDA the encoder and classifier heads run in FP16, halving weight
+    bandwidth and enabling tensor cores, falling back to FP32 if that
+    fails. On CPU the model is left in FP32: the ECAPA encoder is built
+    from Conv1d blocks and the classifier head applies a bare parameter
+    via F.linear, so dynamic INT8 quantization — which only rewrites
+    nn.Linear modules — would match nothing.
+
+    Args:
+        model: The freshly loaded model.
+
+    Returns:
+        EncoderClassifier: The optimized (or original) model.
+    """
+    try:
+        if torch.cuda.is_available():
+            model.mods.embedding_model.half()
+            model.mods.classifier.half()
+            logger.info("Running model in FP16 on GPU")
+    except Exception as e:
+        logger.warning(f"Reduced-precision optimization unavailable: {str(e)}")
+
+    return model
+
 
 class AccentClassifier:
     """Handles accent classification using SpeechBrain models."""
@@ -33,32 +208,142 @@ class AccentClassifier:
         Args:
             model_path: Path to the model. Uses config default if None.
         """
-        if not DEPENDENCIES_AVAILABLE:
+        if not _import_backend():
             raise DependencyError(
                 "Required dependencies are not available. Please install "
-                "torch, pydub, speechbrain, and yt-dlp."
+                "torch, speechbrain, and yt-dlp."
             )
 
         config = get_config()
         self.model_path = model_path or config.get("model.path")
         self.cache_dir = config.get("model.cache_dir")
+        self.sample_rate = config.get("audio.sample_rate")
+        self.max_seconds = config.get("audio.max_seconds")
+        self.vad_enabled = config.get("vad.enabled", True)
+
+        self.device = torch.device("cuda" if torch.cuda.is_available() else "cpu")
+
+        # FP16 inference is only used on CUDA; CPU uses INT8 quantization
+        self.half_precision = self.device.type == "cuda"
 
         self.model: Optional[EncoderClassifier] = None
+        self._export_embedding: Optional[Any] = None
+        self._ort_session: Optional[Any] = None
+        self._class_labels: List[str] = []
         self._load_model()
+        self._init_onnx()
+        self._warm_up()
 
     def _load_model(self) -> None:
-        """Load the SpeechBrain model."""
+        """Load the SpeechBrain model, reusing the process-wide cache."""
         try:
-            # Set cache directory if specified
-            if self.cache_dir:
-                os.environ["TORCH_HOME"] = self.cache_dir
+            self.model, self._export_embedding = _get_model(
+                self.model_path, self.cache_dir
+            )
 
-            self.model = EncoderClassifier.from_hparams(self.model_path)
+            # Decode the label list once; it is fixed for a loaded model
+            label_encoder = self.model.hparams.label_encoder
+            self._class_labels = list(
+                label_encoder.decode_ndim(torch.arange(label_encoder.num_labels))
+            )
         except Exception as e:
             raise ClassificationError(
                 f"Failed to load accent classification model: {str(e)}"
             )
 
+    def _warm_up(self) -> None:
+        """Classify one second of silence to pay one-time costs eagerly.
+
+        The first forward pass triggers cuDNN algorithm selection and
+        lazy CUDA context init (hundreds of ms to over a second); doing
+        it at construction keeps that latency off the first user
+        request. Failures are harmless and only logged.
+        """
+        if self.model is None:
+            return
+
+        try:
+            # Input lengths are fixed after trimming, so autotune pays off
+            torch.backends.cudnn.benchmark = True
+
+            silence = torch.zeros(1, self.sample_rate)
+            if self.half_precision:
+                silence = silence.half()
+            silence = silence.to(self.device)
+
+            with torch.inference_mode():
+                self.model.classify_batch(silence, torch.ones(1, device=self.device))
+        except Exception as e:
+            logger.warning(f"Model warm-up failed: {str(e)}")
+
+    def _init_onnx(self) -> None:
+        """Export the embedding model to ONNX and open an ORT session.
+
+        ONNX Runtime applies operator fusion and constant folding that
+        eager PyTorch does not, typically a 2-3x speedup on CPU. The
+        exported graph is cached on disk and reused across sessions.
+        The export reads the FP32 embedding module captured at load
+        time, before any optimization rewrites it. Any failure leaves
+        the PyTorch path in place.
+        """
+        if not ONNXRUNTIME_AVAILABLE or self.model is None or self.half_precision:
+            return
+
+        try:
+            cache_dir = Path(self.cache_dir or Path.home() / ".accent_classifier")
+            onnx_path = cache_dir / "ecapa_embedding.onnx"
+
+            if not onnx_path.exists():
+                cache_dir.mkdir(parents=True, exist_ok=True)
+                # The embedding model consumes fbank features: (batch, time, mels)
+                dummy_feats = torch.zeros(1, 200, 80)
+                torch.onnx.export(
+                    self._export_embedding,
+                    dummy_feats,
+                    str(onnx_path),
+                    input_names=["feats"],
+                    output_names=["embedding"],
+                    dynamic_axes={"feats": {0: "batch", 1: "time"}},
+                    opset_version=17,
+                )
+                logger.info(f"Exported embedding model to {onnx_path}")
+
+            self._ort_session = onnxruntime.InferenceSession(str(onnx_path))
+            logger.info("Using ONNX Runtime for embedding inference")
+        except Exception as e:
+            self._ort_session = None
+            logger.warning(f"ONNX Runtime unavailable, using PyTorch: {str(e)}")
+
+    def _compute_logits(self, waveform: "torch.Tensor") -> "torch.Tensor":
+        """Run the model forward pass on a prepared waveform batch.
+
+        Uses the ONNX Runtime session for the embedding model when one
+        is available, otherwise SpeechBrain's classify_batch.
+
+        Args:
+            waveform: Prepared waveform batch of shape (batch, samples).
+
+        Returns:
+            torch.Tensor: Logits of shape (batch, num_labels).
+
+        Raises:
+            ClassificationError: If no model is loaded.
+        """
+        if self.model is None:
+            raise ClassificationError("Accent classification model is not loaded")
+
+        with torch.inference_mode():
+            if self._ort_session is None:
+                logits, _, _, _ = self.model.classify_batch(waveform)
+                return logits
+
+            # Mirror EncoderClassifier.encode_batch with the ORT embedding model
+            wav_lens = torch.ones(waveform.shape[0])
+            feats = self.model.mods.compute_features(waveform.float())
+            feats = self.model.mods.mean_var_norm(feats, wav_lens)
+            embedding = self._ort_session.run(None, {"feats": feats.cpu().numpy()})[0]
+            return self.model.mods.classifier(torch.from_numpy(embedding)).squeeze(1)
+
     def classify_accent(self, wav_path: str) -> Tuple[str, str]:
         """Classify the English accent in the given WAV audio file.
 
@@ -69,6 +354,32 @@ class AccentClassifier:
             tuple: (result_string, best_label) where result_string contains
                    all accent probabilities and best_label is the most probable accent.
 
+        Raises:
+            DependencyError: If required dependencies are not available.
+            ClassificationError: If classification fails.
+        """
+        logger.info(f"Classifying audio file: {wav_path}")
+
+        try:
+            waveform, sample_rate = torchaudio.load(wav_path)
+        except Exception as e:
+            raise ClassificationError(f"Failed to load audio file: {str(e)}")
+
+        return self.classify_waveform(waveform, sample_rate)
+
+    def predict_label(self, wav_path: str) -> str:
+        """Return only the most probable accent label for a WAV file.
+
+        Skips the softmax and probability-table formatting entirely: the
+        argmax of the logits equals the argmax of their softmax, so
+        callers that only need the best label avoid the extra pass.
+
+        Args:
+            wav_path: Path to the WAV audio file to classify.
+
+        Returns:
+            str: The most probable accent label.
+
         Raises:
             DependencyError: If required dependencies are not available.
             ClassificationError: If classification fails.
@@ -76,42 +387,398 @@ class AccentClassifier:
         if not DEPENDENCIES_AVAILABLE or self.model is None:
             raise DependencyError(
                 "Required dependencies are not available. Please install "
-                "torch, pydub, speechbrain, and yt-dlp."
+                "torch, speechbrain, and yt-dlp."
             )
 
-        # Ensure the file exists
-        if not os.path.exists(wav_path):
-            raise ClassificationError(f"Audio file not found: {wav_path}")
+        try:
+            waveform, sample_rate = torchaudio.load(wav_path)
+            waveform = self._prepare_waveform(waveform, sample_rate)
+            logits = self._compute_logits(waveform)
+            return self._class_labels[int(logits.argmax(dim=1).item())]
+        except Exception as e:
+            raise ClassificationError(f"Accent classification failed: {str(e)}")
 
-        # Normalize the path to absolute path to avoid Windows path issues
-        wav_path = os.path.abspath(wav_path)
-        # Convert backslashes to forward slashes to avoid escape character issues
-        wav_path = wav_path.replace("\\", "/")
-        logger.info(f"Classifying audio file: {wav_path}")
+    def classify_wav_bytes(self, wav_bytes: bytes) -> Tuple[str, str]:
+        """Classify the English accent in in-memory WAV data.
+
+        Args:
+            wav_bytes: WAV-encoded audio data.
 
+        Returns:
+            tuple: (result_string, best_label) as for classify_accent.
+
+        Raises:
+            DependencyError: If required dependencies are not available.
+            ClassificationError: If classification fails.
+        """
         try:
-            # Perform classification
-            logits, _, _, _ = self.model.classify_file(wav_path)
-            probs = F.softmax(logits, dim=1)
-            class_labels = self.model.hparams.label_encoder.decode_ndim(
-                torch.arange(probs.shape[1])
-            )
+            waveform, sample_rate = torchaudio.load(io.BytesIO(wav_bytes))
+        except Exception as e:
+            raise ClassificationError(f"Failed to decode audio data: {str(e)}")
+
+        return self.classify_waveform(waveform, sample_rate)
 
-            # Build result string
-            result = "Accent probabilities:\n\n"
-            for i, lbl in enumerate(class_labels):
-                probability = probs[0, i].item() * 100
-                result += f"{str(lbl):<20}: {probability:>6.2f}%\n"
+    def classify_waveform(
+        self, waveform: "torch.Tensor", sample_rate: int
+    ) -> Tuple[str, str]:
+        """Classify the English accent in an in-memory waveform.
 
-            # Find the most probable accent
-            best_index = torch.argmax(probs, dim=1).item()
-            best_label = class_labels[best_index]
+        Args:
+            waveform: Audio tensor of shape (channels, samples) or (samples,).
+            sample_rate: Sample rate of the waveform in Hz.
 
-            return result, best_label
+        Returns:
+            tuple: (result_string, best_label) as for classify_accent.
+
+        Raises:
+            DependencyError: If required dependencies are not available.
+            ClassificationError: If classification fails.
+        """
+        if not DEPENDENCIES_AVAILABLE or self.model is None:
+            raise DependencyError(
+                "Required dependencies are not available. Please install "
+                "torch, speechbrain, and yt-dlp."
+            )
 
+        try:
+            # Perform classification on the in-memory tensor
+            waveform = self._prepare_waveform(waveform, sample_rate)
+            logits = self._compute_logits(waveform)
+            return self._format_result(logits)
         except Exception as e:
             raise ClassificationError(f"Accent classification failed: {str(e)}")
 
+    def _prepare_waveform(
+        self, waveform: "torch.Tensor", sample_rate: int
+    ) -> "torch.Tensor":
+        """Downmix and resample a waveform for the model.
+
+        Args:
+            waveform: Audio tensor of shape (channels, samples) or (samples,).
+            sample_rate: Sample rate of the waveform in Hz.
+
+        Returns:
+            torch.Tensor: Mono waveform of shape (1, samples) at the
+            configured sample rate.
+        """
+        if waveform.dim() == 1:
+            waveform = waveform.unsqueeze(0)
+        if waveform.shape[0] > 1:
+            waveform = waveform.mean(dim=0, keepdim=True)
+
+        if sample_rate != self.sample_rate:
+            waveform = torchaudio.functional.resample(
+                waveform, sample_rate, self.sample_rate
+            )
+
+        waveform = self._trim_speech(waveform)
+
+        if self.half_precision:
+            waveform = waveform.half()
+
+        if self.device.type == "cuda":
+            # Pinned host memory enables an async (non-blocking) H2D copy
+            waveform = waveform.pin_memory().to(self.device, non_blocking=True)
+
+        return waveform
+
+    def _trim_speech(self, waveform: "torch.Tensor") -> "torch.Tensor":
+        """Trim a waveform to the first max_seconds of detected speech.
+
+        Encoder compute scales linearly with audio length and ECAPA
+        embeddings stabilize within a few seconds, so classifying a
+        whole multi-minute video is wasted work. Uses Silero VAD to pick
+        voiced samples when enabled, falling back to a plain prefix when
+        VAD is unavailable or finds no speech.
+
+        Args:
+            waveform: Mono waveform of shape (1, samples) at the
+                configured sample rate.
+
+        Returns:
+            torch.Tensor: Trimmed waveform of shape (1, samples).
+        """
+        if not self.max_seconds:
+            return waveform
+
+        max_samples = int(self.max_seconds * self.sample_rate)
+        if waveform.shape[1] <= max_samples:
+            return waveform
+
+        if self.vad_enabled:
+            try:
+                vad_model, get_speech_timestamps = _get_vad()
+                segments = get_speech_timestamps(
+                    waveform.squeeze(0), vad_model, sampling_rate=self.sample_rate
+                )
+                if segments:
+                    voiced = torch.cat(
+                        [
+                            waveform[:, segment["start"] : segment["end"]]
+                            for segment in segments
+                        ],
+                        dim=1,
+                    )
+                    return voiced[:, :max_samples]
+            except Exception as e:
+                logger.warning(f"VAD unavailable, trimming without it: {str(e)}")
+
+        return waveform[:, :max_samples]
+
+    def _format_result(self, logits: "torch.Tensor") -> Tuple[str, str]:
+        """Build the result string and best label from model logits.
+
+        Args:
+            logits: Model output of shape (1, num_labels).
+
+        Returns:
+            tuple: (result_string, best_label).
+        """
+        probs = F.softmax(logits, dim=1)
+        class_labels = self._class_labels
+
+        # Move probabilities to the host once instead of one .item() per label
+        percentages = probs[0].detach().cpu().numpy() * 100.0
+
+        # Build result string
+        result = (
+            "Accent probabilities:\n\n"
+            + "\n".join(
+                f"{str(lbl):<20}: {value:>6.2f}%"
+                for lbl, value in zip(class_labels, percentages)
+            )
+            + "\n"
+        )
+
+        # Find the most probable accent
+        best_label = class_labels[int(percentages.argmax())]
+
+        return result, best_label
+
+    def classify_batch_files(self, wav_paths: List[str]) -> List[Tuple[str, str]]:
+        """Classify several WAV files in a single batched forward pass.
+
+        Waveforms are padded to a common length and classified together,
+        amortizing kernel launch overhead across the batch instead of
+        paying it once per file.
+
+        Args:
+            wav_paths: Paths to the WAV audio files to classify.
+
+        Returns:
+            list: One (result_string, best_label) tuple per input file,
+            in input order.
+
+        Raises:
+            DependencyError: If required dependencies are not available.
+            ClassificationError: If classification fails.
+        """
+        if not DEPENDENCIES_AVAILABLE or self.model is None:
+            raise DependencyError(
+                "Required dependencies are not available. Please install "
+                "torch, speechbrain, and yt-dlp."
+            )
+
+        if not wav_paths:
+            return []
+
+        try:
+            waveforms = []
+            for wav_path in wav_paths:
+                waveform, sample_rate = torchaudio.load(wav_path)
+                waveforms.append(
+                    self._prepare_waveform(waveform, sample_rate).squeeze(0)
+                )
+
+            lengths = torch.tensor(
+                [waveform.shape[0] for waveform in waveforms], dtype=torch.float
+            )
+            batch = torch.nn.utils.rnn.pad_sequence(waveforms, batch_first=True)
+            wav_lens = lengths / lengths.max()
+            if self.device.type == "cuda":
+                wav_lens = wav_lens.to(self.device)
+
+            with torch.inference_mode():
+                logits, _, _, _ = self.model.classify_batch(batch, wav_lens)
+            return [
+                self._format_result(logits[i : i + 1]) for i in range(len(wav_paths))
+            ]
+        except Exception as e:
+            raise ClassificationError(f"Batch accent classification failed: {str(e)}")
+
+    def classify_from_url(
+        self,
+        youtube_url: str,
+        audio_processor: Optional[AudioProcessor] = None,
+        cache: Union[None, str, Path] = "default",
+    ) -> Tuple[str, str]:
+        """Classify the English accent in a YouTube video.
+
+        Results are cached on disk keyed by the video ID, so repeated
+        requests for the same video skip the download and inference
+        pipeline entirely.
+
+        Args:
+            youtube_url: The YouTube video URL to classify.
+            audio_processor: AudioProcessor to use for downloading.
+                A new one is created if None.
+            cache: Cache directory to use. "default" uses
+                ~/.accent_classifier/cache, None disables caching, and
+                any other value is treated as a directory path.
+
+        Returns:
+            tuple: (result_string, best_label) as for classify_accent.
+
+        Raises:
+            DependencyError: If required dependencies are not available.
+            DownloadError: If download fails.
+            AudioProcessingError: If audio conversion fails.
+            ClassificationError: If classification fails.
+        """
+        cache_file = self._cache_file_for(youtube_url, cache)
+        if cache_file is not None:
+            cached = self._read_cached_result(cache_file)
+            if cached is not None:
+                logger.info(f"Using cached classification for {youtube_url}")
+                return cached
+
+        processor = audio_processor or AudioProcessor()
+        wav_bytes = self._fetch_audio(processor, youtube_url)
+        result, best_label = self.classify_wav_bytes(wav_bytes)
+
+        if cache_file is not None:
+            self._write_cached_result(cache_file, result, best_label)
+
+        return result, best_label
+
+    def classify_from_urls(
+        self,
+        urls: List[str],
+        max_workers: int = 4,
+        audio_processor: Optional[AudioProcessor] = None,
+        cache: Union[None, str, Path] = "default",
+    ) -> Dict[str, Optional[Tuple[str, str]]]:
+        """Classify several YouTube videos, downloading in parallel.
+
+        Downloads are I/O-bound and overlap across a thread pool; the
+        single classifier consumes the audio as each download finishes.
+        Cached results are served without downloading at all.
+
+        Args:
+            urls: YouTube video URLs to classify.
+            max_workers: Maximum number of concurrent downloads.
+            audio_processor: AudioProcessor to use for downloading.
+                A new one is created if None.
+            cache: Cache directory, as for classify_from_url.
+
+        Returns:
+            dict: Mapping of URL to (result_string, best_label), or to
+            None for URLs whose processing failed.
+
+        Raises:
+            DependencyError: If required dependencies are not available.
+        """
+        processor = audio_processor or AudioProcessor()
+        results: Dict[str, Optional[Tuple[str, str]]] = {}
+
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            future_to_url = {}
+            for url in urls:
+                cache_file = self._cache_file_for(url, cache)
+                cached = (
+                    self._read_cached_result(cache_file)
+                    if cache_file is not None
+                    else None
+                )
+                if cached is not None:
+                    logger.info(f"Using cached classification for {url}")
+                    results[url] = cached
+                    continue
+
+                future = executor.submit(self._fetch_audio, processor, url)
+                future_to_url[future] = url
+
+            for future in as_completed(future_to_url):
+                url = future_to_url[future]
+                try:
+                    outcome = self.classify_wav_bytes(future.result())
+                except AccentClassifierError as e:
+                    logger.error(f"Processing failed for {url}: {str(e)}")
+                    results[url] = None
+                    continue
+
+                results[url] = outcome
+                cache_file = self._cache_file_for(url, cache)
+                if cache_file is not None:
+                    self._write_cached_result(cache_file, *outcome)
+
+        return results
+
+    def _fetch_audio(self, processor: AudioProcessor, youtube_url: str) -> bytes:
+        """Fetch WAV bytes for a URL, preferring the diskless stream path.
+
+        Args:
+            processor: AudioProcessor used for downloading.
+            youtube_url: The YouTube video URL to fetch.
+
+        Returns:
+            bytes: WAV-encoded audio data.
+
+        Raises:
+            DownloadError: If download fails.
+            AudioProcessingError: If audio conversion fails.
+        """
+        try:
+            return processor.stream_wav_bytes(youtube_url)
+        except AccentClassifierError as e:
+            logger.info(f"Streaming failed, falling back to file download: {str(e)}")
+
+        wav_path = processor.download_and_convert_to_wav(youtube_url)
+        try:
+            with open(wav_path, "rb") as f:
+                return f.read()
+        except OSError as e:
+            # Keep the documented contract: callers handle
+            # AccentClassifierError, not raw filesystem errors
+            raise AudioProcessingError(f"Reading downloaded audio failed: {str(e)}")
+        finally:
+            processor.cleanup_temp_file(wav_path)
+
+    @staticmethod
+    def _cache_file_for(
+        youtube_url: str, cache: Union[None, str, Path]
+    ) -> Optional[Path]:
+        """Resolve the cache file path for a URL, or None if uncacheable."""
+        if cache is None:
+            return None
+        video_id = _extract_video_id(youtube_url)
+        if not video_id:
+            return None
+        cache_dir = _DEFAULT_CACHE_DIR if cache == "default" else Path(cache)
+        return cache_dir / f"{video_id}.json"
+
+    @staticmethod
+    def _read_cached_result(cache_file: Path) -> Optional[Tuple[str, str]]:
+        """Read a cached classification result, if present and valid."""
+        try:
+            with open(cache_file, "r", encoding="utf-8") as f:
+                cached = json.load(f)
+            return cached["result"], cached["best_label"]
+        except (OSError, ValueError, KeyError):
+            return None
+
+    @staticmethod
+    def _write_cached_result(cache_file: Path, result: str, best_label: str) -> None:
+        """Atomically write a classification result to the cache."""
+        try:
+            cache_file.parent.mkdir(parents=True, exist_ok=True)
+            fd, temp_path = tempfile.mkstemp(dir=str(cache_file.parent), suffix=".tmp")
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump({"result": result, "best_label": best_label}, f)
+            os.replace(temp_path, cache_file)
+        except OSError:
+            pass  # Caching is best-effort; ignore write failures
+
     def get_supported_accents(self) -> list[str]:
         """Get the list of supported accent types.
 
@@ -124,9 +791,4 @@ class AccentClassifier:
         if self.model is None:
             raise ClassificationError("Model not loaded. Cannot retrieve accent list.")
 
-        try:
-            return self.model.hparams.label_encoder.decode_ndim(
-                torch.arange(self.model.hparams.label_encoder.num_labels)
-            ).tolist()
-        except Exception as e:
-            raise ClassificationError(f"Failed to retrieve accent list: {str(e)}")
+        return list(self._class_labels)
@@ -2,13 +2,14 @@
 
 import logging
 import os
+import subprocess
 import tempfile
+import threading
 import warnings
-from typing import Optional
+from typing import Any, Dict, Optional
 
 try:
     import yt_dlp
-    from pydub import AudioSegment
 
     DEPENDENCIES_AVAILABLE = True
 except ImportError as e:
@@ -36,7 +37,7 @@ class AudioProcessor:
         if not DEPENDENCIES_AVAILABLE:
             raise DependencyError(
                 "Required dependencies are not available. Please install "
-                "torch, pydub, speechbrain, and yt-dlp."
+                "torch, speechbrain, and yt-dlp."
             )
 
         config = get_config()
@@ -45,7 +46,52 @@ class AudioProcessor:
         )
         self.youtube_format = config.get("youtube.format")
         self.audio_format = config.get("youtube.audio_format")
-        self.audio_quality = config.get("youtube.audio_quality")
+        self.sample_rate = config.get("audio.sample_rate")
+        self.channels = config.get("audio.channels")
+
+        # One YoutubeDL instance per processor: constructing one re-parses
+        # every extractor plugin, which costs ~100 ms per call. The lock
+        # serializes access since downloads may run on worker threads.
+        self._ydl = yt_dlp.YoutubeDL(self._base_opts())
+        self._ydl_lock = threading.Lock()
+
+    def _base_opts(self) -> Dict[str, Any]:
+        """Build the yt-dlp options shared by all downloads."""
+        return {
+            "format": self.youtube_format,
+            # Prefer smaller streams; the model resamples to 16 kHz anyway
+            "format_sort": ["+size", "+br"],
+            "outtmpl": {"default": os.path.join(self.temp_dir, "audio.%(ext)s")},
+            "postprocessors": [
+                {
+                    "key": "FFmpegExtractAudio",
+                    "preferredcodec": self.audio_format,
+                }
+            ],
+            # Keyed by pp_key().lower(); "FFmpegExtractAudio" would
+            # silently never match
+            "postprocessor_args": {
+                "extractaudio": [
+                    "-ar",
+                    str(self.sample_rate),
+                    "-ac",
+                    str(self.channels),
+                ]
+            },
+            "quiet": True,
+            "no_warnings": True,
+            # Add options to handle various YouTube issues
+            "extractor_args": {
+                "youtube": {
+                    "player_client": ["android", "web"],
+                    "player_skip": ["js", "configs"],
+                }
+            },
+        }
+
+    def _set_outtmpl(self, outtmpl: str) -> None:
+        """Point the shared YoutubeDL instance at a new output template."""
+        self._ydl.params["outtmpl"]["default"] = outtmpl
 
     def download_and_convert_to_wav(self, youtube_url: str) -> str:
         """Download audio from YouTube URL and convert it to WAV format.
@@ -64,71 +110,129 @@ class AudioProcessor:
         if not DEPENDENCIES_AVAILABLE:
             raise DependencyError(
                 "Required dependencies are not available. Please install "
-                "torch, pydub, speechbrain, and yt-dlp."
+                "torch, speechbrain, and yt-dlp."
             )
 
-        # Create temporary filenames
-        temp_base = os.path.join(self.temp_dir, f"temp_audio_{os.getpid()}")
-        temp_audio_file = f"{temp_base}.{self.audio_format}"
-        temp_wav = f"{temp_base}.wav"
-
         try:
-            # Configure yt-dlp options with fallbacks
-            ydl_opts = {
-                "format": self.youtube_format,
-                "outtmpl": f"{temp_base}.%(ext)s",
-                "postprocessors": [
-                    {
-                        "key": "FFmpegExtractAudio",
-                        "preferredcodec": self.audio_format,
-                        "preferredquality": self.audio_quality,
-                    }
-                ],
-                "quiet": True,
-                "no_warnings": True,
-                # Add options to handle various YouTube issues
-                "extractor_args": {
-                    "youtube": {
-                        "player_client": ["android", "web"],
-                        "player_skip": ["js", "configs"],
-                    }
-                },
-            }
-
-            logger.info(f"Starting download from URL: {youtube_url}")
-            # Download the audio
-            with yt_dlp.YoutubeDL(ydl_opts) as ydl:
-                ydl.download([youtube_url])
-            logger.info("Download completed")
-
-            # Check if audio file was created and has content
-            if not os.path.exists(temp_audio_file):
-                raise DownloadError(f"Failed to download audio from YouTube URL.")
-
-            # Check if the file has any content
-            if os.path.getsize(temp_audio_file) == 0:
-                raise DownloadError(
-                    "Downloaded audio file is empty. The video may not be available, "
-                    "may not contain audio, or may be restricted. Try a different YouTube URL."
+            # Each call gets its own scratch directory, so concurrent
+            # downloads never collide and partial files are swept up
+            # automatically on error
+            with tempfile.TemporaryDirectory(dir=self.temp_dir) as download_dir:
+                downloaded_wav = os.path.join(
+                    download_dir, f"audio.{self.audio_format}"
                 )
 
-            logger.info(
-                f"Downloaded audio file size: {os.path.getsize(temp_audio_file)} bytes"
-            )
+                logger.info(f"Starting download from URL: {youtube_url}")
+                # Download the audio via the shared YoutubeDL instance
+                with self._ydl_lock:
+                    self._set_outtmpl(os.path.join(download_dir, "audio.%(ext)s"))
+                    self._ydl.download([youtube_url])
+                logger.info("Download completed")
+
+                # Check if audio file was created and has content; one
+                # stat covers both the existence and the size check
+                try:
+                    download_stat = os.stat(downloaded_wav)
+                except FileNotFoundError:
+                    raise DownloadError(f"Failed to download audio from YouTube URL.")
+
+                if download_stat.st_size == 0:
+                    raise DownloadError(
+                        "Downloaded audio file is empty. The video may not be available, "
+                        "may not contain audio, or may be restricted. Try a different YouTube URL."
+                    )
+
+                logger.info(
+                    f"Downloaded audio file size: {download_stat.st_size} bytes"
+                )
 
-            # Convert to WAV
-            audio = AudioSegment.from_file(temp_audio_file)
-            audio.export(temp_wav, format="wav")
+                # Move the finished WAV to a stable path before the
+                # scratch directory is removed
+                fd, temp_wav = tempfile.mkstemp(
+                    prefix="accent_audio_",
+                    suffix=f".{self.audio_format}",
+                    dir=self.temp_dir,
+                )
+                os.close(fd)
+                os.replace(downloaded_wav, temp_wav)
 
             logger.info(f"Audio processing complete, returning WAV path: {temp_wav}")
             return temp_wav
 
         except Exception as e:
             raise AudioProcessingError(f"Audio processing failed: {str(e)}")
-        finally:
-            # Clean up temporary audio file
-            if os.path.exists(temp_audio_file):
-                os.remove(temp_audio_file)
+
+    def stream_wav_bytes(self, youtube_url: str) -> bytes:
+        """Fetch audio from a YouTube URL as in-memory WAV bytes.
+
+        Resolves the direct audio stream URL without downloading, then
+        pipes it through ffmpeg to WAV at the configured sample rate and
+        channel count on stdout, so no intermediate file touches disk.
+
+        Args:
+            youtube_url: The YouTube video URL to fetch audio from.
+
+        Returns:
+            bytes: WAV-encoded audio data.
+
+        Raises:
+            DependencyError: If required dependencies are not available.
+            AudioProcessingError: If stream resolution or transcoding fails.
+        """
+        if not DEPENDENCIES_AVAILABLE:
+            raise DependencyError(
+                "Required dependencies are not available. Please install "
+                "torch, speechbrain, and yt-dlp."
+            )
+
+        try:
+            logger.info(f"Resolving audio stream for URL: {youtube_url}")
+            with self._ydl_lock:
+                info = self._ydl.extract_info(youtube_url, download=False)
+
+            stream_url = info.get("url")
+            if not stream_url and info.get("requested_formats"):
+                stream_url = info["requested_formats"][0].get("url")
+            if not stream_url:
+                raise DownloadError("Could not resolve a direct audio stream URL.")
+
+            command = ["ffmpeg", "-loglevel", "error"]
+            http_headers = info.get("http_headers")
+            if http_headers:
+                header_block = "".join(
+                    f"{name}: {value}\r\n" for name, value in http_headers.items()
+                )
+                command += ["-headers", header_block]
+            command += [
+                "-i",
+                stream_url,
+                "-ar",
+                str(self.sample_rate),
+                "-ac",
+                str(self.channels),
+                "-f",
+                "wav",
+                "-",
+            ]
+
+            completed = subprocess.run(
+                command,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.DEVNULL,
+                check=True,
+            )
+
+            if not completed.stdout:
+                raise DownloadError(
+                    "Streamed audio is empty. The video may not be available, "
+                    "may not contain audio, or may be restricted. Try a different YouTube URL."
+                )
+
+            logger.info(f"Streamed {len(completed.stdout)} bytes of WAV audio")
+            return completed.stdout
+
+        except Exception as e:
+            raise AudioProcessingError(f"Audio streaming failed: {str(e)}")
 
     def cleanup_temp_file(self, file_path: str) -> None:
         """Clean up temporary audio file.
@@ -137,7 +241,6 @@ class AudioProcessor:
             file_path: Path to the temporary file to remove.
         """
         try:
-            if os.path.exists(file_path):
-                os.remove(file_path)
+            os.remove(file_path)
         except OSError:
-            pass  # Ignore cleanup errors
+            pass  # Ignore cleanup errors (including a missing file)
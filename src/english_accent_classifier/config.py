@@ -1,15 +1,277 @@
 """Configuration management for the English Accent Classifier."""
 
+import copy
+import functools
 import os
+import pickle
+import tempfile
 from pathlib import Path
-from typing import Any, Dict, Optional
+from types import SimpleNamespace
+from typing import TYPE_CHECKING, Any, Dict, Optional
 
-try:
+if TYPE_CHECKING:
     import yaml
+else:
+    # PyYAML is imported lazily by _import_yaml(): paths that never read
+    # a config file from disk (defaults-only runs, most tests) skip its
+    # import cost entirely
+    yaml = None
 
-    YAML_AVAILABLE = True
-except ImportError:
-    YAML_AVAILABLE = False
+YAML_AVAILABLE: Optional[bool] = None
+
+# Resolved by _import_yaml(): the libyaml-backed C loader/dumper when
+# PyYAML was built against libyaml (several times faster on parse),
+# otherwise the pure-Python safe variants
+_SafeLoader: Any = None
+_SafeDumper: Any = None
+
+
+def _import_yaml() -> bool:
+    """Import PyYAML on first use.
+
+    Returns:
+        bool: True if PyYAML is available.
+    """
+    global yaml, YAML_AVAILABLE, _SafeLoader, _SafeDumper
+
+    if YAML_AVAILABLE is None:
+        try:
+            import yaml as _yaml
+        except ImportError:
+            YAML_AVAILABLE = False
+        else:
+            yaml = _yaml
+            try:
+                _SafeLoader = _yaml.CSafeLoader
+                _SafeDumper = _yaml.CSafeDumper
+            except AttributeError:
+                _SafeLoader = _yaml.SafeLoader
+                _SafeDumper = _yaml.SafeDumper
+            YAML_AVAILABLE = True
+
+    return YAML_AVAILABLE
+
+
+# Sentinel distinguishing "key missing" from a stored None
+_MISSING = object()
+
+# Default config file location, resolved once at import: the Path walk
+# and exists() check are pure overhead when repeated per Config(), and
+# installs never grow a config file mid-process
+_DEFAULT_PATH = str(Path(__file__).parent.parent.parent / "config" / "default.yaml")
+_DEFAULT_EXISTS = os.path.exists(_DEFAULT_PATH)
+
+
+def _flatten_config(config: Dict[str, Any]) -> Dict[str, Any]:
+    """Flatten a nested config tree into a dotted-key leaf dict.
+
+    Args:
+        config: Nested configuration dictionary.
+
+    Returns:
+        dict: Mapping of dotted leaf keys (e.g. 'gui.font_size') to
+        their values.
+    """
+    flat: Dict[str, Any] = {}
+    stack = [("", config)]
+
+    while stack:
+        prefix, node = stack.pop()
+        for key, value in node.items():
+            dotted = f"{prefix}{key}"
+            if isinstance(value, dict) and value:
+                stack.append((f"{dotted}.", value))
+            else:
+                flat[dotted] = value
+
+    return flat
+
+
+@functools.lru_cache(maxsize=256)
+def _split_key(key: str) -> tuple:
+    """Split a dotted configuration key, memoized per key string.
+
+    Hot callers (the GUI issues a dozen gets per window build) hit the
+    same few key strings repeatedly; caching the split avoids a fresh
+    list allocation on every lookup.
+    """
+    return tuple(key.split("."))
+
+
+# Shared default configuration; static content, so it is allocated
+# once at import instead of rebuilt per Config construction. Callers
+# needing a mutable copy go through _get_default_config().
+_DEFAULT_CONFIG: Dict[str, Any] = {
+    "app": {
+        "name": "English Accent Classifier",
+        "version": "1.0.0",
+        "description": "A tool for identifying English accents from YouTube videos",
+    },
+    "audio": {
+        "temp_dir": None,
+        "sample_rate": 16000,
+        "channels": 1,
+        "max_seconds": 10,
+    },
+    "vad": {"enabled": True},
+    "model": {
+        "path": "Jzuluaga/accent-id-commonaccent_ecapa",
+        "cache_dir": None,
+    },
+    "youtube": {
+        "format": "bestaudio[abr>=32]/bestaudio",
+        "audio_format": "wav",
+    },
+    "logging": {
+        "level": "INFO",
+        "format": "%(asctime)s - %(name)s - %(levelname)s - %(message)s",
+        "file": None,
+    },
+    "gui": {
+        "title": "English Accent Classifier",
+        "width": 600,
+        "height": 500,
+        "font_family": "Arial",
+        "font_size": 10,
+    },
+}
+
+
+def _get_default_config() -> Dict[str, Any]:
+    """Get a mutable copy of the default configuration values."""
+    return copy.deepcopy(_DEFAULT_CONFIG)
+
+
+def _build_namespace(node: Dict[str, Any]) -> SimpleNamespace:
+    """Convert a nested config dict into a SimpleNamespace tree.
+
+    Args:
+        node: Nested configuration dictionary.
+
+    Returns:
+        SimpleNamespace mirroring the dict, with sub-dicts converted
+        recursively.
+    """
+    return SimpleNamespace(
+        **{
+            key: (
+                _build_namespace(value)
+                if isinstance(value, dict)
+                # Lists are copied so the view never exposes the shared
+                # cached tree to mutation
+                else copy.deepcopy(value) if isinstance(value, list) else value
+            )
+            for key, value in node.items()
+        }
+    )
+
+
+def _merge_configs(base: Dict[str, Any], override: Dict[str, Any]) -> Dict[str, Any]:
+    """Merge two configuration dictionaries without recursion.
+
+    Updates a single deep copy of ``base`` in place, driven by an
+    explicit stack, instead of allocating a new dict (and a Python call
+    frame) per nesting level.
+    """
+    result = copy.deepcopy(base)
+    stack = [(result, override)]
+
+    while stack:
+        destination, source = stack.pop()
+        for key, value in source.items():
+            if isinstance(value, dict) and isinstance(destination.get(key), dict):
+                stack.append((destination[key], value))
+            else:
+                destination[key] = value
+
+    return result
+
+
+def _read_sidecar(
+    config_file: str, file_stat: os.stat_result
+) -> Optional[Dict[str, Any]]:
+    """Load the pickled parse of the config file, if still current.
+
+    Args:
+        config_file: Path to the YAML config file.
+        file_stat: Stat result of the YAML config file.
+
+    Returns:
+        The previously parsed configuration, or None if the sidecar is
+        missing, stale, or unreadable.
+    """
+    try:
+        parsed: Dict[str, Any]
+        with open(config_file + ".pkl", "rb") as f:
+            mtime, size, parsed = pickle.load(f)
+        if mtime == file_stat.st_mtime and size == file_stat.st_size:
+            return parsed
+    except Exception:
+        pass
+    return None
+
+
+def _write_sidecar(
+    config_file: str, file_stat: os.stat_result, parsed: Dict[str, Any]
+) -> None:
+    """Atomically cache the parsed config next to the YAML file.
+
+    Caching is best-effort; failures (e.g. a read-only config directory)
+    are silently ignored.
+
+    Args:
+        config_file: Path to the YAML config file.
+        file_stat: Stat result of the YAML config file.
+        parsed: The parsed configuration to cache.
+    """
+    try:
+        directory = os.path.dirname(config_file) or "."
+        fd, temp_path = tempfile.mkstemp(dir=directory, suffix=".tmp")
+        with os.fdopen(fd, "wb") as f:
+            pickle.dump((file_stat.st_mtime, file_stat.st_size, parsed), f)
+        os.replace(temp_path, config_file + ".pkl")
+    except Exception:
+        pass
+
+
+@functools.lru_cache(maxsize=32)
+def _load_config_dict(config_file: str, mtime: float) -> Dict[str, Any]:
+    """Parse and merge a configuration file, memoized process-wide.
+
+    Repeated Config constructions for the same unchanged file reuse the
+    already-merged dictionary instead of re-reading and re-parsing it.
+
+    Args:
+        config_file: Absolute path to the YAML config file.
+        mtime: The file's mtime (0.0 if missing); part of the cache key
+            so a modified file is re-parsed.
+
+    Returns:
+        The merged configuration. Callers must deep-copy before mutating.
+    """
+    if not mtime or not _import_yaml():
+        # Callers deep-copy before mutating, so the shared constant can
+        # be handed out directly
+        return _DEFAULT_CONFIG
+
+    try:
+        file_stat = os.stat(config_file)
+
+        # Reuse the parsed-YAML sidecar when it is still current;
+        # unpickling is much cheaper than re-parsing the YAML
+        loaded_config = _read_sidecar(config_file, file_stat)
+        if loaded_config is None:
+            # Binary mode: the YAML loader handles decoding itself, and
+            # libyaml consumes bytes directly without the text wrapper
+            with open(config_file, "rb") as f:
+                loaded_config = yaml.load(f, Loader=_SafeLoader) or {}
+            _write_sidecar(config_file, file_stat, loaded_config)
+
+        # Merge with defaults (_merge_configs deep-copies its base)
+        return _merge_configs(_DEFAULT_CONFIG, loaded_config)
+    except Exception:
+        # Fall back to defaults on any error
+        return _DEFAULT_CONFIG
 
 
 class Config:
@@ -21,87 +283,44 @@ class Config:
         Args:
             config_file: Path to configuration file. If None, uses default.
         """
-        self.config_file = config_file or self._get_default_config_path()
+        self.config_file = config_file or _DEFAULT_PATH
         self._config: Dict[str, Any] = {}
 
         self._load_config()
 
     def _get_default_config_path(self) -> str:
         """Get the default configuration file path."""
-        # Try to find config relative to the package
-        package_dir = Path(__file__).parent.parent.parent
-        config_path = package_dir / "config" / "default.yaml"
-        return str(config_path)
+        return _DEFAULT_PATH
 
     def _load_config(self) -> None:
-        """Load configuration from file."""
-        if not YAML_AVAILABLE:
-            # Use default configuration if yaml is not available
-            self._config = self._get_default_config()
-            return
-
-        try:
-            if os.path.exists(self.config_file):
-                with open(self.config_file, "r", encoding="utf-8") as f:
-                    loaded_config = yaml.safe_load(f) or {}
-                # Merge with defaults
-                defaults = self._get_default_config()
-                self._config = self._merge_configs(defaults, loaded_config)
-            else:
-                self._config = self._get_default_config()
-        except Exception:
-            # Fall back to defaults on any error
-            self._config = self._get_default_config()
-
-    def _get_default_config(self) -> Dict[str, Any]:
-        """Get default configuration values."""
-        return {
-            "app": {
-                "name": "English Accent Classifier",
-                "version": "1.0.0",
-                "description": "A tool for identifying English accents from YouTube videos",
-            },
-            "audio": {"temp_dir": None, "sample_rate": 16000, "channels": 1},
-            "model": {
-                "path": "Jzuluaga/accent-id-commonaccent_ecapa",
-                "cache_dir": None,
-            },
-            "youtube": {
-                "format": "bestaudio/best",
-                "audio_format": "mp3",
-                "audio_quality": "192",
-            },
-            "logging": {
-                "level": "INFO",
-                "format": "%(asctime)s - %(name)s - %(levelname)s - %(message)s",
-                "file": None,
-            },
-            "gui": {
-                "title": "English Accent Classifier",
-                "width": 600,
-                "height": 500,
-                "font_family": "Arial",
-                "font_size": 10,
-            },
-        }
-
-    def _merge_configs(
-        self, base: Dict[str, Any], override: Dict[str, Any]
-    ) -> Dict[str, Any]:
-        """Recursively merge two configuration dictionaries."""
-        result = base.copy()
-
-        for key, value in override.items():
-            if (
-                key in result
-                and isinstance(result[key], dict)
-                and isinstance(value, dict)
-            ):
-                result[key] = self._merge_configs(result[key], value)
-            else:
-                result[key] = value
-
-        return result
+        """Load configuration from file via the process-wide cache."""
+        # Default path with no shipped config file: skip the stat and
+        # serve defaults straight from the cache key (0.0 mtime)
+        if self.config_file == _DEFAULT_PATH and not _DEFAULT_EXISTS:
+            config_file = _DEFAULT_PATH
+            mtime = 0.0
+        else:
+            config_file = os.path.abspath(self.config_file)
+            try:
+                mtime = os.path.getmtime(config_file)
+            except OSError:
+                mtime = 0.0
+
+        # Copy-on-write: share the cached dict until the first set().
+        # Read-only instances (the common case) never pay the deepcopy.
+        self._config = _load_config_dict(config_file, mtime)
+        self._dirty = False
+
+        # Parallel flat view serving leaf lookups in one hash access
+        self._flat = _flatten_config(self._config)
+
+        # Attribute-access view, built lazily by namespace()
+        self._namespace: Optional[SimpleNamespace] = None
+
+    @classmethod
+    def clear_cache(cls) -> None:
+        """Drop all memoized config parses (mainly for tests)."""
+        _load_config_dict.cache_clear()
 
     def get(self, key: str, default: Any = None) -> Any:
         """Get a configuration value by key.
@@ -113,15 +332,26 @@ class Config:
         Returns:
             Configuration value or default
         """
-        keys = key.split(".")
+        # Leaf keys resolve in a single hash lookup regardless of depth
+        value = self._flat.get(key, _MISSING)
+        if value is not _MISSING:
+            # List and empty-dict leaves are still shared mutable objects
+            return copy.deepcopy(value) if isinstance(value, (dict, list)) else value
+
+        # Non-leaf keys (whole subtrees) still walk the nested dict;
+        # misses return via dict.get rather than raising, keeping the
+        # exception machinery off this path entirely
         value = self._config
+        for k in _split_key(key):
+            if not isinstance(value, dict):
+                return default
+            value = value.get(k, _MISSING)
+            if value is _MISSING:
+                return default
 
-        try:
-            for k in keys:
-                value = value[k]
-            return value
-        except (KeyError, TypeError):
-            return default
+        # Deep-copy container reads: the nested tree may be the shared
+        # cached dict, which caller mutations must never reach
+        return copy.deepcopy(value) if isinstance(value, (dict, list)) else value
 
     def set(self, key: str, value: Any) -> None:
         """Set a configuration value.
@@ -130,7 +360,17 @@ class Config:
             key: Dot-separated configuration key
             value: Value to set
         """
-        keys = key.split(".")
+        # First write takes a private copy so the mutation never leaks
+        # into the shared cached dict
+        if not self._dirty:
+            self._config = copy.deepcopy(self._config)
+            self._flat = _flatten_config(self._config)
+            self._dirty = True
+
+        # The namespace view is rebuilt on next access
+        self._namespace = None
+
+        keys = _split_key(key)
         config = self._config
 
         # Navigate to the parent of the final key
@@ -142,13 +382,44 @@ class Config:
         # Set the final value
         config[keys[-1]] = value
 
+        # Keep the flat view in sync: drop anything shadowed by this
+        # write, then re-add the new leaves
+        prefix = f"{key}."
+        for stale_key in [k for k in self._flat if k == key or k.startswith(prefix)]:
+            del self._flat[stale_key]
+
+        # An ancestor that used to be a leaf (e.g. "model.path" after
+        # set("model.path.sub", ...)) is now a dict; purge its old entry
+        for i in range(1, len(keys)):
+            self._flat.pop(".".join(keys[:i]), None)
+        if isinstance(value, dict):
+            for sub_key, sub_value in _flatten_config(value).items():
+                self._flat[f"{prefix}{sub_key}"] = sub_value
+        else:
+            self._flat[key] = value
+
+    def namespace(self) -> SimpleNamespace:
+        """Get an attribute-access view of the configuration.
+
+        Callers with static keys can read ``cfg.namespace().gui.width``
+        instead of ``cfg.get("gui.width")``: attribute access skips the
+        key split and dict walk entirely. The view is a snapshot; it is
+        rebuilt after any set().
+
+        Returns:
+            SimpleNamespace tree mirroring the configuration.
+        """
+        if self._namespace is None:
+            self._namespace = _build_namespace(self._config)
+        return self._namespace
+
     def save(self, file_path: Optional[str] = None) -> None:
         """Save current configuration to file.
 
         Args:
             file_path: Path to save to. If None, uses current config file.
         """
-        if not YAML_AVAILABLE:
+        if not _import_yaml():
             raise ImportError("PyYAML is required to save configuration files")
 
         save_path = file_path or self.config_file
@@ -157,7 +428,13 @@ class Config:
         os.makedirs(os.path.dirname(save_path), exist_ok=True)
 
         with open(save_path, "w", encoding="utf-8") as f:
-            yaml.safe_dump(self._config, f, default_flow_style=False, indent=2)
+            yaml.dump(
+                self._config,
+                f,
+                Dumper=_SafeDumper,
+                default_flow_style=False,
+                indent=2,
+            )
 
 
 # Global configuration instance
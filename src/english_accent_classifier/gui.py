@@ -1,31 +1,128 @@
 """Graphical User Interface for the English Accent Classifier."""
 
+import functools
 import logging
-import tkinter as tk
-from tkinter import messagebox
-from typing import Callable
+import queue
+import threading
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Callable, Optional
 
 from .accent_classifier import AccentClassifier
 from .audio_processor import AudioProcessor
-from .config import get_config
+from .config import Config, get_config
 from .exceptions import AccentClassifierError
 
+if TYPE_CHECKING:
+    import tkinter as tk
+    from tkinter import messagebox
+else:
+    # tkinter is imported lazily by _import_tk(): loading Tk costs tens
+    # of ms that CLI and test paths importing this module never need to
+    # pay
+    tk = None
+    messagebox = None
+
 logger = logging.getLogger(__name__)
 
+# Static name-to-level table; avoids a getattr lookup on the logging
+# module every time run_gui resolves the configured level. The WARN and
+# FATAL aliases keep configs that getattr used to accept working.
+_LEVEL_MAP = {
+    name: getattr(logging, name)
+    for name in ("DEBUG", "INFO", "WARNING", "WARN", "ERROR", "CRITICAL", "FATAL")
+}
+
+
+def _import_tk() -> None:
+    """Import tkinter on first use.
+
+    Raises:
+        ImportError: If tkinter is not available.
+    """
+    global tk, messagebox
+
+    # mypy sees the TYPE_CHECKING import and considers this branch dead
+    if tk is None:
+        import tkinter as _tk  # type: ignore[unreachable]
+        from tkinter import messagebox as _messagebox
+
+        tk = _tk
+        messagebox = _messagebox
+
+
+@dataclass(frozen=True)
+class GuiParams:
+    """Precomputed ``gui.*`` configuration values.
+
+    Built once at startup so widget construction reads plain attributes
+    instead of walking the config per widget.
+    """
+
+    title: str
+    width: int
+    height: int
+    font_family: str
+    font_size: int
+
+    @classmethod
+    def from_config(cls, config: Config) -> "GuiParams":
+        """Build the parameter set from a Config instance."""
+        gui_config = config.namespace().gui
+        return cls(
+            title=gui_config.title,
+            width=gui_config.width,
+            height=gui_config.height,
+            font_family=gui_config.font_family,
+            font_size=gui_config.font_size,
+        )
+
+
+@functools.lru_cache(maxsize=1)
+def _get_audio_processor() -> AudioProcessor:
+    """Get the process-wide AudioProcessor instance."""
+    return AudioProcessor()
+
+
+@functools.lru_cache(maxsize=1)
+def _get_classifier() -> AccentClassifier:
+    """Get the process-wide AccentClassifier instance.
+
+    Constructing a classifier loads the model weights, so a rebuilt GUI
+    (tests, future multi-window use) must reuse the existing instance
+    rather than load them again.
+    """
+    return AccentClassifier()
+
+
+def invalidate_components() -> None:
+    """Drop the cached component singletons (mainly for tests)."""
+    _get_audio_processor.cache_clear()
+    _get_classifier.cache_clear()
+
 
 class AccentClassifierGUI:
     """GUI application for English accent classification."""
 
-    def __init__(self):
-        """Initialize the GUI application."""
-        try:
-            self.audio_processor = AudioProcessor()
-            self.classifier = AccentClassifier()
-        except Exception as e:
-            logger.error(
-                f"Failed to initialize audio processor or classifier: {str(e)}"
-            )
-            raise RuntimeError(f"Failed to initialize application components: {str(e)}")
+    def __init__(self, params: Optional[GuiParams] = None):
+        """Initialize the GUI application.
+
+        The audio processor and classifier are constructed on a
+        background thread: importing torch and loading model weights
+        takes seconds, and deferring them lets the window appear
+        immediately while the backend warms up.
+
+        Args:
+            params: Precomputed GUI parameters. Derived from the global
+                config when None.
+        """
+        _import_tk()
+
+        # Bound once; every widget-building config read goes through it
+        self._cfg = get_config()
+        self.params = params or GuiParams.from_config(self._cfg)
+
+        self.audio_processor: Optional[AudioProcessor] = None
+        self.classifier: Optional[AccentClassifier] = None
 
         # GUI elements
         self.root: tk.Tk = None
@@ -35,41 +132,72 @@ class AccentClassifierGUI:
         self.result_text: tk.Text = None
         self.scrollbar: tk.Scrollbar = None
 
-    def create_gui(self) -> tk.Tk:
+        # Queue used to marshal results from the worker thread back to Tk
+        self._queue: queue.Queue = queue.Queue()
+        self._components_ready = threading.Event()
+
+        threading.Thread(target=self._init_components, daemon=True).start()
+
+    def _init_components(self) -> None:
+        """Construct the audio processor and classifier off the main thread."""
+        try:
+            self.audio_processor = _get_audio_processor()
+            self.classifier = _get_classifier()
+            self._queue.put(("status", "Ready to analyze accents...", "#666666"))
+        except Exception as e:
+            logger.error(
+                f"Failed to initialize audio processor or classifier: {str(e)}"
+            )
+            self._queue.put(
+                (
+                    "error",
+                    f"Failed to initialize application components: {str(e)}",
+                    "Initialization failed",
+                )
+            )
+        finally:
+            self._components_ready.set()
+
+    def create_gui(self) -> "tk.Tk":
         """Create and configure the GUI elements.
 
         Returns:
             tk.Tk: The root window of the application.
         """
-        config = get_config()
+        params = self.params
 
         self.root = tk.Tk()
-        self.root.title(config.get("gui.title"))
-        width = config.get("gui.width")
-        height = config.get("gui.height")
-        self.root.geometry(f"{width}x{height}")
+        self.root.title(params.title)
+        self.root.geometry(f"{params.width}x{params.height}")
         self.root.resizable(True, True)
 
         # Create widgets
         self._create_widgets()
         self._layout_widgets()
 
+        # Permanent poller for messages from background threads
+        self.root.after(100, self._poll_queue)
+
         return self.root
 
     def _create_widgets(self) -> None:
         """Create all GUI widgets."""
-        config = get_config()
+        # Read the font params once and share the tuples across widgets
+        font_family = self.params.font_family
+        font_size = self.params.font_size
+        font_body = (font_family, font_size)
+        font_label = (font_family, font_size + 2)
+        font_button = (font_family, font_size + 2, "bold")
+        font_mono = ("Courier", font_size)
 
         # URL input
-        font_family = config.get("gui.font_family")
-        font_size = config.get("gui.font_size")
         tk.Label(
             self.root,
             text="Enter YouTube Video URL:",
-            font=(font_family, font_size + 2),
+            font=font_label,
         ).pack(pady=(20, 5))
 
-        self.url_entry = tk.Entry(self.root, width=60, font=(font_family, font_size))
+        self.url_entry = tk.Entry(self.root, width=60, font=font_body)
         self.url_entry.pack(pady=(0, 20))
 
         # Process button
@@ -77,7 +205,7 @@ class AccentClassifierGUI:
             self.root,
             text="Analyze Accent",
             command=self._process_video,
-            font=(font_family, font_size + 2, "bold"),
+            font=font_button,
             bg="#4CAF50",
             fg="white",
             padx=20,
@@ -89,15 +217,15 @@ class AccentClassifierGUI:
         self.status_label = tk.Label(
             self.root,
             text="Ready to analyze accents...",
-            font=(font_family, font_size),
+            font=font_body,
             fg="#666666",
         )
         self.status_label.pack(pady=(0, 10))
 
         # Results text area
-        tk.Label(
-            self.root, text="Classification Results:", font=(font_family, font_size + 2)
-        ).pack(pady=(10, 5))
+        tk.Label(self.root, text="Classification Results:", font=font_label).pack(
+            pady=(10, 5)
+        )
 
         # Create a frame for text area and scrollbar
         text_frame = tk.Frame(self.root)
@@ -111,7 +239,7 @@ class AccentClassifierGUI:
             text_frame,
             height=15,
             width=70,
-            font=("Courier", font_size),
+            font=font_mono,
             wrap=tk.WORD,
             yscrollcommand=self.scrollbar.set,
         )
@@ -124,53 +252,99 @@ class AccentClassifierGUI:
         pass  # Using pack layout, no additional layout needed
 
     def _process_video(self) -> None:
-        """Process the video URL and display results."""
+        """Start processing the video URL on a background thread.
+
+        The download and classification run in a worker thread so the Tk
+        event loop keeps pumping; results are marshalled back to the main
+        thread via a queue drained by ``_poll_queue``.
+        """
         url = self.url_entry.get().strip()
 
         if not url:
             messagebox.showerror("Error", "Please enter a YouTube URL.")
             return
 
-        try:
-            # Update UI
-            self._set_processing_state(True)
-            self.status_label.config(
-                text="Downloading and processing audio...", fg="#FF9800"
-            )
-            self.root.update()
+        # Disable inputs while the worker runs to prevent re-entrancy
+        self._set_processing_state(True)
+        self.status_label.config(
+            text="Downloading and processing audio...", fg="#FF9800"
+        )
 
-            # Process audio
-            logger.info(f"Processing URL: {url}")
-            wav_path = self.audio_processor.download_and_convert_to_wav(url)
+        worker = threading.Thread(
+            target=self._process_video_worker, args=(url,), daemon=True
+        )
+        worker.start()
 
-            try:
-                # Classify accent
-                result, most_probable_accent = self.classifier.classify_accent(wav_path)
+    def _process_video_worker(self, url: str) -> None:
+        """Download and classify the video off the Tk main thread.
 
-                # Update UI with results
-                self.result_text.delete("1.0", tk.END)
-                self.result_text.insert(tk.END, result)
-                self.status_label.config(
-                    text=f"Most probable accent: {most_probable_accent}", fg="#4CAF50"
+        Args:
+            url: The YouTube URL to process.
+        """
+        # Block until the background component construction has finished
+        self._components_ready.wait()
+        if self.audio_processor is None or self.classifier is None:
+            self._queue.put(
+                (
+                    "error",
+                    "Application components failed to initialize.",
+                    "Initialization failed",
                 )
+            )
+            return
 
-                logger.info(f"Classification complete: {most_probable_accent}")
+        try:
+            logger.info(f"Processing URL: {url}")
+            result, most_probable_accent = self.classifier.classify_from_url(
+                url, audio_processor=self.audio_processor
+            )
 
-            finally:
-                # Clean up temporary file
-                self.audio_processor.cleanup_temp_file(wav_path)
+            self._queue.put(("result", result, most_probable_accent))
 
         except AccentClassifierError as e:
             logger.error(f"Processing failed: {str(e)}")
-            messagebox.showerror("Error", str(e))
-            self.status_label.config(text="Processing failed", fg="#F44336")
+            self._queue.put(("error", str(e), "Processing failed"))
         except Exception as e:
             logger.error(f"Unexpected error: {str(e)}")
-            messagebox.showerror("Error", f"An unexpected error occurred: {str(e)}")
-            self.status_label.config(text="Unexpected error", fg="#F44336")
-        finally:
+            self._queue.put(
+                ("error", f"An unexpected error occurred: {str(e)}", "Unexpected error")
+            )
+
+    def _poll_queue(self) -> None:
+        """Drain worker messages and apply UI updates on the main thread."""
+        finished = False
+
+        try:
+            while True:
+                message = self._queue.get_nowait()
+
+                if message[0] == "status":
+                    _, status_text, color = message
+                    self.status_label.config(text=status_text, fg=color)
+                elif message[0] == "result":
+                    _, result, most_probable_accent = message
+                    # Single atomic replace; delete+insert would redraw
+                    # the emptied widget before the new text lands
+                    self.result_text.replace("1.0", tk.END, result)
+                    self.status_label.config(
+                        text=f"Most probable accent: {most_probable_accent}",
+                        fg="#4CAF50",
+                    )
+                    logger.info(f"Classification complete: {most_probable_accent}")
+                    finished = True
+                elif message[0] == "error":
+                    _, error_message, status_text = message
+                    messagebox.showerror("Error", error_message)
+                    self.status_label.config(text=status_text, fg="#F44336")
+                    finished = True
+        except queue.Empty:
+            pass
+
+        if finished:
             self._set_processing_state(False)
 
+        self.root.after(100, self._poll_queue)
+
     def _set_processing_state(self, processing: bool) -> None:
         """Set the processing state of the GUI.
 
@@ -207,7 +381,7 @@ def run_gui() -> None:
         log_file = config.get("logging.file")
 
         # Convert string level to logging level
-        numeric_level = getattr(logging, log_level.upper(), logging.INFO)
+        numeric_level = _LEVEL_MAP.get(log_level.upper(), logging.INFO)
 
         log_config = {"level": numeric_level, "format": log_format}
 
@@ -217,15 +391,20 @@ def run_gui() -> None:
         logging.basicConfig(**log_config)
         logger.info("Logging configured successfully")
 
-        # Test tkinter functionality
-        print("Testing tkinter compatibility...")
+        # Create and run GUI. No throwaway Tk() probe: a missing or
+        # misconfigured display surfaces as tk.TclError from the real
+        # window construction, so only one Tcl interpreter is created.
+        print("Creating GUI application...")
         try:
-            test_root = tk.Tk()
-            test_root.withdraw()  # Hide the window
-            test_root.quit()
-            test_root.destroy()
-            print("Tkinter test successful")
+            gui = AccentClassifierGUI(params=GuiParams.from_config(config))
+            print("GUI application created, starting main loop...")
+            gui.run()
         except Exception as tk_error:
+            # tk.TclError can only be named once _import_tk() succeeded
+            if not isinstance(tk_error, ImportError) and not (
+                tk is not None and isinstance(tk_error, tk.TclError)
+            ):
+                raise
             print(f"Tkinter not available or not properly configured: {tk_error}")
             print("This might be due to running in an environment without GUI support.")
             print(
@@ -233,12 +412,6 @@ def run_gui() -> None:
             )
             return
 
-        # Create and run GUI
-        print("Creating GUI application...")
-        gui = AccentClassifierGUI()
-        print("GUI application created, starting main loop...")
-        gui.run()
-
     except Exception as e:
         # If we get here, logging might not be set up yet
         print(f"Error starting GUI application: {e}")
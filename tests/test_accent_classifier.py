@@ -0,0 +1,81 @@
+"""Tests for accent classifier helpers."""
+
+import shutil
+import tempfile
+import unittest
+from pathlib import Path
+
+from english_accent_classifier.accent_classifier import (
+    AccentClassifier,
+    _extract_video_id,
+)
+
+
+class TestVideoIdExtraction(unittest.TestCase):
+    """Test cases for YouTube video ID extraction."""
+
+    def test_extract_video_id_url_forms(self):
+        """Test extraction from the common YouTube URL forms."""
+        for url in (
+            "https://www.youtube.com/watch?v=dQw4w9WgXcQ",
+            "https://youtu.be/dQw4w9WgXcQ",
+            "https://www.youtube.com/embed/dQw4w9WgXcQ",
+            "https://www.youtube.com/shorts/dQw4w9WgXcQ",
+            "https://www.youtube.com/watch?v=dQw4w9WgXcQ&t=42",
+        ):
+            with self.subTest(url=url):
+                self.assertEqual(_extract_video_id(url), "dQw4w9WgXcQ")
+
+    def test_extract_video_id_invalid(self):
+        """Test that URLs without a video ID return None."""
+        self.assertIsNone(_extract_video_id("https://example.com/watch"))
+        self.assertIsNone(_extract_video_id("not a url"))
+
+
+class TestResultCache(unittest.TestCase):
+    """Test cases for the classification result cache."""
+
+    def setUp(self):
+        """Set up a scratch cache directory."""
+        self.cache_dir = tempfile.mkdtemp()
+
+    def tearDown(self):
+        """Remove the scratch cache directory."""
+        shutil.rmtree(self.cache_dir, ignore_errors=True)
+
+    def test_cache_file_for(self):
+        """Test cache path resolution."""
+        cache_file = AccentClassifier._cache_file_for(
+            "https://youtu.be/dQw4w9WgXcQ", self.cache_dir
+        )
+        self.assertEqual(cache_file, Path(self.cache_dir) / "dQw4w9WgXcQ.json")
+
+        # No cache directory or no extractable video ID means no caching
+        self.assertIsNone(
+            AccentClassifier._cache_file_for("https://youtu.be/dQw4w9WgXcQ", None)
+        )
+        self.assertIsNone(
+            AccentClassifier._cache_file_for("https://example.com", self.cache_dir)
+        )
+
+    def test_cache_round_trip(self):
+        """Test that a written result reads back unchanged."""
+        cache_file = Path(self.cache_dir) / "dQw4w9WgXcQ.json"
+
+        AccentClassifier._write_cached_result(cache_file, "us: 80%", "us")
+
+        self.assertEqual(
+            AccentClassifier._read_cached_result(cache_file), ("us: 80%", "us")
+        )
+
+    def test_read_missing_or_corrupt_cache(self):
+        """Test that missing or corrupt cache files read as None."""
+        cache_file = Path(self.cache_dir) / "missing.json"
+        self.assertIsNone(AccentClassifier._read_cached_result(cache_file))
+
+        cache_file.write_text("not json")
+        self.assertIsNone(AccentClassifier._read_cached_result(cache_file))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,9 +1,10 @@
 """Tests for audio processor."""
 
 import os
+import shutil
 import tempfile
 import unittest
-from unittest.mock import MagicMock, patch
+from unittest.mock import patch
 
 from english_accent_classifier.audio_processor import AudioProcessor
 from english_accent_classifier.exceptions import (
@@ -16,16 +17,19 @@ from english_accent_classifier.exceptions import (
 class TestAudioProcessor(unittest.TestCase):
     """Test cases for AudioProcessor class."""
 
-    def setUp(self):
-        """Set up test fixtures."""
-        self.temp_dir = tempfile.mkdtemp()
+    @classmethod
+    def setUpClass(cls):
+        """Create one scratch directory shared by the whole class.
 
-    def tearDown(self):
-        """Clean up test fixtures."""
-        # Clean up temp directory
-        import shutil
+        Every file the tests create gets a unique name, so sharing the
+        directory is safe and avoids a mkdtemp/rmtree pair per test.
+        """
+        cls.temp_dir = tempfile.mkdtemp()
 
-        shutil.rmtree(self.temp_dir, ignore_errors=True)
+    @classmethod
+    def tearDownClass(cls):
+        """Remove the shared scratch directory."""
+        shutil.rmtree(cls.temp_dir, ignore_errors=True)
 
     @patch("english_accent_classifier.audio_processor.DEPENDENCIES_AVAILABLE", False)
     def test_missing_dependencies(self):
@@ -55,54 +59,69 @@ class TestAudioProcessor(unittest.TestCase):
         processor.cleanup_temp_file(temp_file)
         self.assertFalse(os.path.exists(temp_file))
 
+    @patch("english_accent_classifier.audio_processor.DEPENDENCIES_AVAILABLE", True)
+    def test_postprocessor_args_resolve(self):
+        """Test that yt-dlp actually passes the sample-rate/channel args."""
+        from yt_dlp.postprocessor import FFmpegExtractAudioPP
+
+        processor = AudioProcessor(temp_dir=self.temp_dir)
+
+        # Resolve the args the way the postprocessor itself does, so a
+        # wrong postprocessor_args key cannot silently drop them
+        post_processor = FFmpegExtractAudioPP(
+            processor._ydl, preferredcodec=processor.audio_format
+        )
+        args = post_processor._configuration_args("ffmpeg")
+
+        self.assertIn("-ar", args)
+        self.assertEqual(args[args.index("-ar") + 1], str(processor.sample_rate))
+        self.assertIn("-ac", args)
+        self.assertEqual(args[args.index("-ac") + 1], str(processor.channels))
+
     @patch("english_accent_classifier.audio_processor.DEPENDENCIES_AVAILABLE", True)
     @patch("english_accent_classifier.audio_processor.yt_dlp")
-    @patch("english_accent_classifier.audio_processor.AudioSegment")
-    def test_download_and_convert_success(self, mock_audio_segment, mock_yt_dlp):
+    def test_download_and_convert_success(self, mock_yt_dlp):
         """Test successful audio download and conversion."""
         # Mock the YouTube downloader
-        mock_ydl_instance = MagicMock()
-        mock_yt_dlp.YoutubeDL.return_value.__enter__.return_value = mock_ydl_instance
-
-        # Mock AudioSegment
-        mock_audio = MagicMock()
-        mock_audio_segment.from_file.return_value = mock_audio
+        mock_ydl_instance = mock_yt_dlp.YoutubeDL.return_value
+        mock_ydl_instance.params = {"outtmpl": {"default": ""}}
 
         processor = AudioProcessor(temp_dir=self.temp_dir)
 
-        # Create the expected audio file that the mock should "download"
-        temp_audio_file = os.path.join(
-            self.temp_dir, f"temp_audio_{os.getpid()}.{processor.audio_format}"
+        # "Download" by writing the expected WAV into the scratch directory
+        def fake_download(urls):
+            outtmpl = mock_ydl_instance.params["outtmpl"]["default"]
+            wav_path = outtmpl.replace("%(ext)s", processor.audio_format)
+            with open(wav_path, "w") as f:
+                f.write("mock audio data")
+
+        mock_ydl_instance.download.side_effect = fake_download
+
+        result = processor.download_and_convert_to_wav(
+            "https://youtube.com/watch?v=test"
         )
-        with open(temp_audio_file, "w") as f:
-            f.write("mock audio data")
 
         try:
-            result = processor.download_and_convert_to_wav(
-                "https://youtube.com/watch?v=test"
-            )
-
             # Check that the result is a WAV file path
             self.assertTrue(result.endswith(".wav"))
-            self.assertTrue(os.path.basename(result).startswith("temp_audio_"))
+            self.assertTrue(os.path.basename(result).startswith("accent_audio_"))
+            self.assertTrue(os.path.exists(result))
 
             # Verify mocks were called
             mock_ydl_instance.download.assert_called_once_with(
                 ["https://youtube.com/watch?v=test"]
             )
-            mock_audio.export.assert_called_once()
         finally:
             # Clean up
-            if os.path.exists(temp_audio_file):
-                os.remove(temp_audio_file)
+            processor.cleanup_temp_file(result)
 
     @patch("english_accent_classifier.audio_processor.DEPENDENCIES_AVAILABLE", True)
     @patch("english_accent_classifier.audio_processor.yt_dlp")
     def test_download_failure(self, mock_yt_dlp):
         """Test download failure handling."""
         # Mock the YouTube downloader
-        mock_ydl_instance = MagicMock()
-        mock_yt_dlp.YoutubeDL.return_value.__enter__.return_value = mock_ydl_instance
+        mock_ydl_instance = mock_yt_dlp.YoutubeDL.return_value
+        mock_ydl_instance.params = {"outtmpl": {"default": ""}}
 
         processor = AudioProcessor(temp_dir=self.temp_dir)
 
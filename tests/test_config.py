@@ -1,5 +1,6 @@
 """Tests for configuration management."""
 
+import os
 import tempfile
 import unittest
 from pathlib import Path
@@ -78,6 +79,80 @@ audio:
         config.set("audio.sample_rate", 44100)
         self.assertEqual(config.get("audio.sample_rate"), 44100)
 
+    def test_set_does_not_leak_across_instances(self):
+        """Test that set() on one instance never affects another."""
+        config = Config()
+        other = Config()
+
+        config.set("gui.width", 999)
+
+        self.assertEqual(config.get("gui.width"), 999)
+        self.assertEqual(other.get("gui.width"), 600)
+        self.assertEqual(Config().get("gui.width"), 600)
+
+    def test_set_replaces_leaf_with_subtree(self):
+        """Test that writing below a leaf retires the old leaf value."""
+        config = Config()
+
+        config.set("model.path.sub", 1)
+
+        self.assertEqual(config.get("model.path.sub"), 1)
+        self.assertEqual(config.get("model.path"), {"sub": 1})
+
+    def test_get_returns_copies_of_containers(self):
+        """Test that mutating returned dicts/lists cannot corrupt the cache."""
+        config_data = """
+youtube:
+  clients: [android, web]
+"""
+        with tempfile.NamedTemporaryFile(mode="w", suffix=".yaml", delete=False) as f:
+            f.write(config_data)
+            temp_file = f.name
+
+        try:
+            Config(temp_file).get("youtube.clients").append("corrupted")
+            Config(temp_file).get("youtube")["clients"].append("corrupted")
+            Config(temp_file).namespace().youtube.clients.append("corrupted")
+
+            self.assertEqual(
+                Config(temp_file).get("youtube.clients"), ["android", "web"]
+            )
+        finally:
+            Path(temp_file).unlink()
+            Path(temp_file + ".pkl").unlink(missing_ok=True)
+
+    def test_namespace_view(self):
+        """Test attribute access through namespace() and its rebuild on set."""
+        config = Config()
+
+        self.assertEqual(config.namespace().gui.width, 600)
+
+        config.set("gui.width", 800)
+        self.assertEqual(config.namespace().gui.width, 800)
+
+    def test_sidecar_staleness(self):
+        """Test that a modified config file invalidates the pickle sidecar."""
+        with tempfile.NamedTemporaryFile(mode="w", suffix=".yaml", delete=False) as f:
+            f.write('app:\n  name: "First"\n')
+            temp_file = f.name
+
+        try:
+            self.assertEqual(Config(temp_file).get("app.name"), "First")
+            # The first parse caches a sidecar next to the file
+            self.assertTrue(Path(temp_file + ".pkl").exists())
+
+            # Rewrite the file with a distinct mtime; the stale sidecar
+            # and memoized parse must both be bypassed
+            with open(temp_file, "w") as f:
+                f.write('app:\n  name: "Second!"\n')
+            stat = os.stat(temp_file)
+            os.utime(temp_file, (stat.st_atime, stat.st_mtime + 10))
+
+            self.assertEqual(Config(temp_file).get("app.name"), "Second!")
+        finally:
+            Path(temp_file).unlink()
+            Path(temp_file + ".pkl").unlink(missing_ok=True)
+
 
 if __name__ == "__main__":
     unittest.main()
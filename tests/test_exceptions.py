@@ -46,16 +46,16 @@ class TestExceptions(unittest.TestCase):
 
     def test_exception_hierarchy(self):
         """Test that all exceptions inherit from AccentClassifierError."""
-        exceptions = [
-            DependencyError("test"),
-            AudioProcessingError("test"),
-            DownloadError("test"),
-            ClassificationError("test"),
-        ]
-
-        for exc in exceptions:
-            with self.subTest(exception=exc):
-                self.assertIsInstance(exc, AccentClassifierError)
+        # Class-level check: the hierarchy is a property of the classes,
+        # so no instances need to be allocated
+        for exception_class in (
+            DependencyError,
+            AudioProcessingError,
+            DownloadError,
+            ClassificationError,
+        ):
+            with self.subTest(exception_class=exception_class):
+                self.assertTrue(issubclass(exception_class, AccentClassifierError))
 
 
 if __name__ == "__main__":